@@ -2,52 +2,71 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 import pandas as pd
 import numpy as np
 
 
 def _to_year_groups(idx: pd.DatetimeIndex, fy: bool) -> pd.Index:
     if fy:
-        return (idx + pd.DateOffset(months=3)).year
+        # Fiscal year (Oct–Sep): year + 1 for Oct–Dec. Integer arithmetic on the
+        # underlying year/month arrays avoids per-element DateOffset math; mirrors
+        # historical.derive_calendar_and_fiscal.
+        return pd.Index(idx.year.values + (idx.month.values >= 10).astype(np.int32))
     return idx.year
 
 
-def aggregate_model_cy(monthly_df: pd.DataFrame) -> pd.DataFrame:
-    idx = monthly_df.index
-    years = _to_year_groups(idx, fy=False)
-    grouped = monthly_df.groupby(years)
-    # Use min_count=1 for sums to avoid coercing all-NaN groups to 0.0
-    interest_total = grouped['NetInt'].sum(min_count=1)
-    debt_avg = grouped['Debt'].mean()
-    gdp_total = grouped['nominal_gdp'].sum(min_count=1) if 'nominal_gdp' in monthly_df.columns else 0.0
-
-    out = pd.DataFrame({
-        'interest_total': interest_total,
-        'debt_avg': debt_avg,
-        'gdp_total': gdp_total,
-    })
-    # Safe division: r_eff undefined where debt_avg == 0 or NaN
-    out['r_eff'] = np.where(out['debt_avg'] > 0, out['interest_total'] / out['debt_avg'], np.nan)
-    out['interest_pct_gdp'] = np.where(out['gdp_total'] > 0, out['interest_total'] / out['gdp_total'], np.nan)
-    return out
-
-
-def aggregate_model_fy(monthly_df: pd.DataFrame) -> pd.DataFrame:
-    idx = monthly_df.index
-    years = _to_year_groups(idx, fy=True)
-    grouped = monthly_df.groupby(years)
-    interest_total = grouped['NetInt'].sum(min_count=1)
-    debt_avg = grouped['Debt'].mean()
-    gdp_total = grouped['nominal_gdp'].sum(min_count=1) if 'nominal_gdp' in monthly_df.columns else 0.0
-
-    out = pd.DataFrame({
-        'interest_total': interest_total,
-        'debt_avg': debt_avg,
-        'gdp_total': gdp_total,
-    })
-    out['r_eff'] = np.where(out['debt_avg'] > 0, out['interest_total'] / out['debt_avg'], np.nan)
-    out['interest_pct_gdp'] = np.where(out['gdp_total'] > 0, out['interest_total'] / out['gdp_total'], np.nan)
-    return out
+def _aggregate(monthly_df: pd.DataFrame, fy: bool) -> pd.DataFrame:
+    years = _to_year_groups(monthly_df.index, fy=fy)
+    # Group cardinality is tiny (tens of years), so pandas' Grouper machinery
+    # is pure overhead here. Sum/count each column directly with np.bincount
+    # on integer year codes — one pass per column, no hash table. NaNs are
+    # masked out so sums and counts reflect observed months only; all-NaN
+    # groups stay NaN (the min_count=1 semantics of the old groupby).
+    uniques, codes = np.unique(np.asarray(years), return_inverse=True)
+    n_groups = len(uniques)
+
+    def _sum_count(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        finite = np.isfinite(values)
+        sums = np.bincount(codes[finite], weights=values[finite], minlength=n_groups)
+        counts = np.bincount(codes[finite], minlength=n_groups)
+        return sums, counts
+
+    netint_sum, netint_count = _sum_count(monthly_df['NetInt'].to_numpy(dtype=float))
+    debt_sum, debt_count = _sum_count(monthly_df['Debt'].to_numpy(dtype=float))
+    interest_total = np.where(netint_count > 0, netint_sum, np.nan)
+    with np.errstate(invalid='ignore'):
+        debt_avg = debt_sum / debt_count  # count == 0 divides to NaN as desired
+
+    if 'nominal_gdp' in monthly_df.columns:
+        gdp_sum, gdp_count = _sum_count(monthly_df['nominal_gdp'].to_numpy(dtype=float))
+        gdp_total = np.where(gdp_count > 0, gdp_sum, np.nan)
+    else:
+        gdp_total = np.zeros(n_groups)
+
+    # Fill a single C-contiguous block and wrap it once, rather than building
+    # a DataFrame and appending columns (which re-consolidates the blocks and
+    # leaves .values strided for downstream consumers).
+    arr = np.empty((n_groups, 5), dtype=np.float64, order='C')
+    arr[:, 0] = interest_total
+    arr[:, 1] = debt_avg
+    arr[:, 2] = gdp_total
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Safe division: r_eff undefined where debt_avg == 0 or NaN
+        arr[:, 3] = np.where(arr[:, 1] > 0, arr[:, 0] / arr[:, 1], np.nan)
+        arr[:, 4] = np.where(arr[:, 2] > 0, arr[:, 0] / arr[:, 2], np.nan)
+    return pd.DataFrame(
+        arr,
+        # int64 year labels so .loc[2020] hashes natively instead of boxing
+        # the int32 DatetimeIndex.year values
+        index=pd.Index(uniques.astype(np.int64, copy=False)),
+        columns=['interest_total', 'debt_avg', 'gdp_total', 'r_eff', 'interest_pct_gdp'],
+    )
+
+
+aggregate_model_cy = partial(_aggregate, fy=False)
+aggregate_model_fy = partial(_aggregate, fy=True)
 
 
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Tuple
 import itertools
+import os
 import numpy as np
 import pandas as pd
 
@@ -13,37 +15,70 @@ except ImportError: # pytest.ini compatibility
     import transforms
 
 
-def _design_matrix(macro_df: pd.DataFrame, hl_short: float, hl_nb: float) -> tuple[pd.DataFrame, float, float]:
-    alpha_s = transforms.half_life_to_alpha(hl_short)
-    alpha_nb = transforms.half_life_to_alpha(hl_nb)
+def _design_matrix_invariants(macro_df: pd.DataFrame) -> Dict[str, Any]:
+    """Precompute the pieces of the design matrix that do not depend on the
+    half-lives, so the grid search only re-runs the two EMAs per combination.
+
+    Everything is reduced to float64 NumPy arrays once, up front; the per-grid-
+    point step then touches no pandas objects at all.
+    """
     r_nb_raw = transforms.weighted_curve(macro_df['r2y'], macro_df['r5y'], macro_df['r10y'], [0.2, 0.4, 0.4])
-    r_s = transforms.ema(macro_df['r3m'], alpha_s)
-    r_nb = transforms.ema(r_nb_raw, alpha_nb)
-    # Orthogonalize r_nb against r_short to improve identifiability
-    rs = r_s.fillna(method='ffill').fillna(0.0).astype(float)
-    rnb = r_nb.fillna(method='ffill').fillna(0.0).astype(float)
-    denom = float((rs * rs).sum()) or 1.0
-    a = float((rnb * rs).sum()) / denom
-    r_nb_resid = rnb - a * rs
+    r3m = macro_df['r3m'].ffill().fillna(0.0).to_numpy(dtype=np.float64)
+    tips_m = macro_df['pce_infl_m'].ffill().fillna(0.0).to_numpy(dtype=np.float64)
     # Scale GDP to reduce numeric issues
-    gdp = macro_df['nominal_gdp'].ffill().fillna(0.0).astype(float)
-    gdp_scale = float(abs(gdp.iloc[0])) or 1.0
+    gdp = macro_df['nominal_gdp'].ffill().fillna(0.0).to_numpy(dtype=np.float64)
+    gdp_scale = float(abs(gdp[0])) or 1.0
     gdp_scaled = gdp / gdp_scale
-    X = pd.DataFrame({
-        'r_short': rs,
-        'r_nb_resid': r_nb_resid,
-        'tips_m': macro_df['pce_infl_m'].ffill().fillna(0.0).astype(float),
+    return {
+        'index': macro_df.index,
+        'r3m': r3m,
+        'r_nb_raw': np.nan_to_num(r_nb_raw.to_numpy(dtype=np.float64), nan=0.0),
+        'tips_m': tips_m,
         'gdp_scaled': gdp_scaled,
-    }, index=macro_df.index)
-    return X, a, gdp_scale
+        'gdp_scale': gdp_scale,
+    }
 
 
-def _ols(y: pd.Series, X: pd.DataFrame) -> Tuple[np.ndarray, float]:
-    # Solve min ||y - Xb||^2, no intercept
-    A = X.values
-    b = y.values
-    coef, residuals, rank, s = np.linalg.lstsq(A, b, rcond=None)
-    rss = float(residuals[0]) if residuals.size else float(((A @ coef - b) ** 2).sum())
+def _design_matrix_with_emas(inv: Dict[str, Any], hl_short: float, hl_nb: float) -> tuple[np.ndarray, float]:
+    alpha_s = transforms.half_life_to_alpha(hl_short)
+    alpha_nb = transforms.half_life_to_alpha(hl_nb)
+    rs, rnb = transforms._dual_ema_kernel(inv['r3m'], inv['r_nb_raw'], alpha_s, alpha_nb)
+    return _design_matrix_from_emas(inv, rs, rnb)
+
+
+def _design_matrix_from_emas(inv: Dict[str, Any], rs: np.ndarray, rnb: np.ndarray) -> tuple[np.ndarray, float]:
+    # Orthogonalize r_nb against r_short to improve identifiability
+    denom = float((rs * rs).sum()) or 1.0
+    a = float((rnb * rs).sum()) / denom
+    r_nb_resid = rnb - a * rs
+    # Fortran order so the downstream LAPACK solves need no copy.
+    X = np.empty((len(rs), 4), dtype=np.float64, order='F')
+    X[:, 0] = rs
+    X[:, 1] = r_nb_resid
+    X[:, 2] = inv['tips_m']
+    X[:, 3] = inv['gdp_scaled']
+    return X, a
+
+
+def _design_matrix(macro_df: pd.DataFrame, hl_short: float, hl_nb: float) -> tuple[np.ndarray, float, float]:
+    inv = _design_matrix_invariants(macro_df)
+    X, a = _design_matrix_with_emas(inv, hl_short, hl_nb)
+    return X, a, inv['gdp_scale']
+
+
+def _ols(y: np.ndarray, X: np.ndarray) -> Tuple[np.ndarray, float]:
+    # Solve min ||y - Xb||^2, no intercept. The 4x4 normal equations are a
+    # trivial LAPACK solve; the design is orthogonalized so conditioning is
+    # fine. lstsq (full SVD) remains only as the rank-deficient fallback.
+    A = np.asarray(X, dtype=np.float64)
+    b = np.asarray(y, dtype=np.float64)
+    XtX = A.T @ A
+    Xty = A.T @ b
+    try:
+        coef = np.linalg.solve(XtX, Xty)
+    except np.linalg.LinAlgError:
+        coef, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
+    rss = float(((A @ coef - b) ** 2).sum())
     return coef, rss
 
 
@@ -82,24 +117,52 @@ def calibrate_params(ieod_series: pd.Series, macro_df: pd.DataFrame, config: Dic
     # Search grid for half-lives
     hl_short_grid = [3.0, 6.0, 12.0]
     hl_nb_grid = [12.0, 18.0, 24.0, 30.0]
-    best = None
-    for hl_s, hl_nb in itertools.product(hl_short_grid, hl_nb_grid):
-        X, a, gdp_scale = _design_matrix(macro_df, hl_s, hl_nb)
-        coef, rss = _ols(y, X)
-        # Convert orthogonalized coefficients back to original betas
-        beta_nb = float(coef[1])
-        beta_s = float(coef[0]) - a * beta_nb
-        beta_tips = float(coef[2])
-        gamma_scaled = float(coef[3])
-        gamma = gamma_scaled / gdp_scale
-        coef_orig = np.array([beta_s, beta_nb, beta_tips, gamma], dtype=float)
-        params = _coefs_to_params(coef_orig, debt_initial)
-        score = rss
-        if best is None or score < best[0]:
-            best = (score, hl_s, hl_nb, params)
-
-    assert best is not None
-    _, hl_s_b, hl_nb_b, params_b = best
+    inv = _design_matrix_invariants(macro_df)
+    gdp_scale = inv['gdp_scale']
+    combos = list(itertools.product(hl_short_grid, hl_nb_grid))
+    # Both filters run over one shared input each, so evaluate every
+    # half-life in a single batched triangular matmul (transforms.ema_batch)
+    # and assemble the per-combination design matrices from its rows.
+    rs_all = transforms.ema_batch(inv['r3m'], [transforms.half_life_to_alpha(h) for h in hl_short_grid])
+    rnb_all = transforms.ema_batch(inv['r_nb_raw'], [transforms.half_life_to_alpha(h) for h in hl_nb_grid])
+    results = [
+        _design_matrix_from_emas(inv, rs_all[i], rnb_all[j])
+        for i in range(len(hl_short_grid))
+        for j in range(len(hl_nb_grid))
+    ]
+    X_list = [X for X, _ in results]
+    a_list = [a for _, a in results]
+
+    # Solve all G small OLS problems at once via batched normal equations:
+    # one (G,4,4) solve instead of G sequential lstsq round-trips.
+    Xb = np.stack(X_list)  # (G, N, 4)
+    yv = y.to_numpy(dtype=np.float64)
+    XtX = np.einsum('gij,gik->gjk', Xb, Xb)
+    Xty = np.einsum('gij,i->gj', Xb, yv)
+    try:
+        coefs = np.linalg.solve(XtX, Xty[..., None])[..., 0]  # (G, 4)
+    except np.linalg.LinAlgError:
+        # Singular normal equations (e.g. degenerate regressors): fall back
+        # to least-squares per combination, which handles rank deficiency.
+        # The solves are independent LAPACK calls that drop the GIL, so run
+        # them across threads.
+        n_workers = min(len(combos), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            coefs = np.stack(list(pool.map(lambda X: _ols(yv, X)[0], X_list)))
+    resid = np.einsum('gij,gj->gi', Xb, coefs) - yv
+    rss = (resid * resid).sum(axis=-1)
+
+    g_best = int(np.argmin(rss))
+    hl_s_b, hl_nb_b = combos[g_best]
+    coef = coefs[g_best]
+    a = a_list[g_best]
+    # Convert orthogonalized coefficients back to original betas
+    beta_nb = float(coef[1])
+    beta_s = float(coef[0]) - a * beta_nb
+    beta_tips = float(coef[2])
+    gamma = float(coef[3]) / gdp_scale
+    coef_orig = np.array([beta_s, beta_nb, beta_tips, gamma], dtype=float)
+    params_b = _coefs_to_params(coef_orig, debt_initial)
     params_b['hl_SHORT'] = hl_s_b
     params_b['hl_NB'] = hl_nb_b
     return params_b
@@ -19,7 +19,14 @@ import re
 from typing import Optional
 import shutil
 
+import numpy as np
 import pandas as pd
+
+# Copy-on-write makes slices safe to mutate without the defensive .copy()
+# calls this module used to carry (each of which was a full memcpy of the
+# IEOD frame); pandas 3.0 turns this on by default.
+pd.set_option("mode.copy_on_write", True)
+
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -31,6 +38,8 @@ import matplotlib.pyplot as plt
 
 PUBLIC_ISSUES_DESC = "INTEREST EXPENSE ON PUBLIC ISSUES"
 
+_DATE_RE = re.compile(r"(\d{8})")
+
 
 @dataclass(frozen=True)
 class Paths:
@@ -53,20 +62,17 @@ class Paths:
 # Step 1: Interest Expense load
 # -----------------------------
 
-def _parse_date_from_filename(path: Path) -> Optional[pd.Timestamp]:
+def _parse_date_from_filename(path: Path) -> Optional[int]:
     """Try to parse a YYYYMMDD date token from an `IntExp_*` filename.
 
     Supports patterns like `IntExp_20100531_20250731.csv`.
-    Returns the last date token if multiple are present.
+    Returns the last token (typically the coverage end date) as a plain int —
+    callers only need ordering, so no Timestamp construction is required.
     """
-    m = re.findall(r"(\d{8})", path.name)
+    m = _DATE_RE.findall(path.name)
     if not m:
         return None
-    try:
-        # Prefer the last token which is typically the coverage end date
-        return pd.to_datetime(m[-1], format="%Y%m%d", errors="coerce")
-    except Exception:
-        return None
+    return int(m[-1])
 
 
 def find_latest_interest_file(input_dir: Path | str) -> Path:
@@ -84,11 +90,11 @@ def find_latest_interest_file(input_dir: Path | str) -> Path:
             f"No files matching 'IntExp_*' in {in_dir.resolve()}"
         )
 
-    dated: list[tuple[pd.Timestamp, Path]] = []
+    dated: list[tuple[int, Path]] = []
     for p in candidates:
         d = _parse_date_from_filename(p)
-        if d is not None and pd.notna(d):
-            dated.append((pd.Timestamp(d), p))
+        if d is not None:
+            dated.append((d, p))
 
     if dated:
         dated.sort(key=lambda t: t[0])
@@ -106,6 +112,9 @@ def load_interest_expense(path: Path | str) -> pd.DataFrame:
     - Keep columns of interest: `Record Date`, `Current Month Expense Amount`,
       `Expense Type Description`
     - Parse `Record Date` to pandas datetime
+
+    When pyarrow is installed the parse, projection, and category filter run
+    in Arrow's C++ reader over columnar batches; otherwise pandas is used.
     """
     usecols = [
         "Record Date",
@@ -113,24 +122,59 @@ def load_interest_expense(path: Path | str) -> pd.DataFrame:
         "Expense Type Description",
         "Expense Category Description",
     ]
-    df = pd.read_csv(path, usecols=usecols, dtype={"Expense Type Description": "string"})
-
-    # Filter to public issues only
-    mask = df["Expense Category Description"].astype("string") == PUBLIC_ISSUES_DESC
-    df_filtered = df.loc[mask, [
+    keep_cols = [
         "Record Date",
         "Current Month Expense Amount",
         "Expense Type Description",
-    ]].copy()
-
-    # Parse dates
-    df_filtered["Record Date"] = pd.to_datetime(df_filtered["Record Date"], errors="coerce")
-    df_filtered = df_filtered.dropna(subset=["Record Date"])  # drop rows with invalid dates
-
-    # Ensure numeric amount
-    df_filtered["Current Month Expense Amount"] = pd.to_numeric(
-        df_filtered["Current Month Expense Amount"], errors="coerce"
-    )
+    ]
+    try:
+        import pyarrow.dataset as pa_ds
+        import pyarrow.compute as pc
+    except ImportError:
+        pa_ds = None
+
+    if pa_ds is not None:
+        # Stream the CSV in batches with the category predicate applied during
+        # the scan, so peak memory is O(batch) rather than O(file) and only
+        # matching rows are ever materialized.
+        dataset = pa_ds.dataset(path, format="csv")
+        scanner = dataset.scanner(
+            columns=keep_cols,
+            filter=pc.field("Expense Category Description") == PUBLIC_ISSUES_DESC,
+            batch_size=262_144,
+        )
+        df_filtered = scanner.to_table().to_pandas()
+        df_filtered["Expense Type Description"] = df_filtered["Expense Type Description"].astype("string")
+    else:
+        # Category dtype turns the per-row string compare into an int8 code
+        # compare and stores each distinct description once.
+        df = pd.read_csv(
+            path,
+            usecols=usecols,
+            dtype={
+                "Expense Type Description": "string",
+                "Expense Category Description": "category",
+                "Current Month Expense Amount": "float64",
+            },
+        )
+        # Filter to public issues only
+        cat = df["Expense Category Description"].cat
+        if PUBLIC_ISSUES_DESC in cat.categories:
+            code = cat.categories.get_loc(PUBLIC_ISSUES_DESC)
+            mask = cat.codes.to_numpy() == code
+        else:
+            mask = np.zeros(len(df), dtype=bool)
+        df_filtered = df.loc[mask, keep_cols]
+
+    # Parse dates and coerce amounts once, then slice with a single mask
+    # (invalid dates dropped; NaN amounts kept, matching prior behavior)
+    record_date = pd.to_datetime(df_filtered["Record Date"], errors="coerce")
+    amount = pd.to_numeric(df_filtered["Current Month Expense Amount"], errors="coerce")
+    valid = record_date.notna()
+    df_filtered = df_filtered.loc[valid].assign(**{
+        "Record Date": record_date[valid],
+        "Current Month Expense Amount": amount[valid],
+    })
 
     return df_filtered.reset_index(drop=True)
 
@@ -140,12 +184,19 @@ def derive_calendar_and_fiscal(df: pd.DataFrame) -> pd.DataFrame:
 
     Fiscal Year = year + 1 if month >= 10 (Oct–Dec) else year
     """
-    out = df.copy()
-    dates = pd.DatetimeIndex(out["Record Date"]).tz_localize(None)
-    out["Calendar Year"] = dates.year.astype(int)
-    out["Month"] = dates.month.astype(int)
-    out["Fiscal Year"] = (out["Calendar Year"] + (out["Month"] >= 10).astype(int)).astype(int)
-    return out
+    # Record Date is already tz-naive from load_interest_expense, so no
+    # tz_localize pass is needed; assign builds a new frame without copying
+    # the existing column data. Year and month come out of one cast of the
+    # raw datetime64 buffer to month resolution rather than separate
+    # .dt.year/.dt.month accessor passes.
+    months_since_epoch = df["Record Date"].to_numpy("datetime64[ns]").astype("datetime64[M]").astype(np.int64)
+    years = (1970 + months_since_epoch // 12).astype(int)
+    months = (months_since_epoch % 12 + 1).astype(int)
+    return df.assign(**{
+        "Calendar Year": years,
+        "Month": months,
+        "Fiscal Year": years + (months >= 10),
+    })
 
 
 # -----------------------------
@@ -163,17 +214,16 @@ def load_and_expand_gdp(gdp_path: Path | str) -> pd.DataFrame:
     - Keep GDP in billions (input is already in billions)
     - Derive `Year` and `Month` for joining later
     """
-    dfq = pd.read_csv(gdp_path, usecols=["observation_date", "GDP"])  # billions
+    dfq = pd.read_csv(gdp_path, usecols=["observation_date", "GDP"], dtype={"GDP": "float64"})  # billions
     dfq["Date"] = pd.to_datetime(dfq["observation_date"], errors="coerce")
-    dfq = dfq.dropna(subset=["Date"]).copy()
-    dfq = dfq.loc[dfq["Date"].dt.year >= 2000, ["Date", "GDP"]].copy()
-
-    # Normalize to first day of the quarter
-    def quarter_start(ts: pd.Timestamp) -> pd.Timestamp:
-        m = ((ts.month - 1) // 3) * 3 + 1
-        return pd.Timestamp(year=ts.year, month=m, day=1)
-
-    dfq["Date"] = dfq["Date"].apply(quarter_start)
+    dfq = dfq.dropna(subset=["Date"])
+    dfq = dfq.loc[dfq["Date"].dt.year >= 2000, ["Date", "GDP"]]
+
+    # Normalize to first day of the quarter: floor the month ordinal to a
+    # multiple of 3 on the raw datetime64 buffer (one vectorized pass, no
+    # Period objects)
+    month_ord = dfq["Date"].to_numpy("datetime64[M]").astype(np.int64)
+    dfq["Date"] = ((month_ord // 3) * 3).astype("datetime64[M]").astype("datetime64[ns]")
     dfq = dfq.drop_duplicates(subset=["Date"]).sort_values("Date").reset_index(drop=True)
 
     if dfq.empty:
@@ -184,14 +234,16 @@ def load_and_expand_gdp(gdp_path: Path | str) -> pd.DataFrame:
     last = dfq["Date"].max()
     monthly_index = pd.date_range(first, last, freq="MS")  # month start
 
-    # Build monthly frame and align quarter values at quarter starts
-    gdf = pd.DataFrame({"Date": monthly_index})
-    gdf = gdf.merge(dfq[["Date", "GDP"]], on="Date", how="left")
-
-    # Interpolate linearly by index position (equal monthly steps), interior only
-    gdf["GDP_billion"] = gdf["GDP"].interpolate(method="linear", limit_area="inside")
-    gdf.drop(columns=["GDP"], inplace=True)
+    # Interpolate linearly on month ordinals (equal monthly steps, matching the
+    # old position-based interpolate) with a single np.interp call — no merge,
+    # no pandas interpolate dispatcher. Quarter starts bound the monthly range,
+    # so every month is interior and no extrapolation occurs.
+    xq = dfq["Date"].dt.to_period("M").astype("int64").to_numpy()
+    yq = dfq["GDP"].to_numpy(dtype=np.float64)
+    xm = monthly_index.to_period("M").astype("int64").to_numpy()
+    gdp_monthly = np.interp(xm, xq, yq)
 
+    gdf = pd.DataFrame({"Date": monthly_index, "GDP_billion": gdp_monthly})
     gdf["Year"] = gdf["Date"].dt.year.astype(int)
     gdf["Month"] = gdf["Date"].dt.month.astype(int)
     return gdf
@@ -213,15 +265,24 @@ def join_gdp(interest_df: pd.DataFrame, gdp_df: pd.DataFrame) -> pd.DataFrame:
     if not req_gdp_cols.issubset(set(gdp_df.columns)):
         raise ValueError("gdp_df missing required columns")
 
-    merged = interest_df.merge(
-        gdp_df[["Year", "Month", "GDP_billion"]],
-        left_on=["Calendar Year", "Month"],
-        right_on=["Year", "Month"],
-        how="left",
-    )
-    # Drop redundant Year
-    if "Year" in merged.columns:
-        merged = merged.drop(columns=["Year"])  # keep Calendar Year from interest_df
+    # Both sides are keyed by a unique (year, month); collapse to a single
+    # int key and gather via binary search instead of a hash merge.
+    key_i = interest_df["Calendar Year"].to_numpy(dtype=np.int64) * 12 + interest_df["Month"].to_numpy(dtype=np.int64)
+    key_g = gdp_df["Year"].to_numpy(dtype=np.int64) * 12 + gdp_df["Month"].to_numpy(dtype=np.int64)
+    gdp_vals = gdp_df["GDP_billion"].to_numpy(dtype=np.float64)
+    order = np.argsort(key_g, kind="stable")
+    key_g_sorted = key_g[order]
+    gdp_sorted = gdp_vals[order]
+
+    pos = np.searchsorted(key_g_sorted, key_i)
+    pos = np.minimum(pos, max(len(key_g_sorted) - 1, 0))
+    if len(key_g_sorted):
+        matched = key_g_sorted[pos] == key_i
+        values = np.where(matched, gdp_sorted[pos], np.nan)
+    else:
+        values = np.full(len(key_i), np.nan)
+
+    merged = interest_df.assign(GDP_billion=values)
     # Drop rows without GDP coverage
     merged = merged.dropna(subset=["GDP_billion"]).reset_index(drop=True)
     return merged
@@ -231,29 +292,36 @@ def join_gdp(interest_df: pd.DataFrame, gdp_df: pd.DataFrame) -> pd.DataFrame:
 # Step 4: Aggregations and unit columns
 # -----------------------------
 
+def _unit_columns(values: np.ndarray, gdp_billion: Optional[np.ndarray]) -> dict[str, np.ndarray]:
+    """Compute the derived unit columns in one NumPy pass over the buffer.
+
+    Division by zero GDP yields NaN (replacing the old use_inf_as_na toggle).
+    """
+    millions = values / 1_000_000.0
+    billions = values / 1_000_000_000.0
+    cols = {
+        "Interest Expense (millions)": millions,
+        "Interest Expense (billions)": billions,
+    }
+    if gdp_billion is not None:
+        pct = np.full_like(values, np.nan)
+        np.divide(billions, gdp_billion, out=pct, where=gdp_billion != 0)
+        cols["Interest Expense (% GDP)"] = 100.0 * pct
+    return cols
+
+
 def add_unit_columns(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    out["Interest Expense"] = out["Current Month Expense Amount"].astype(float)
-    out["Interest Expense (millions)"] = out["Interest Expense"] / 1_000_000.0
-    out["Interest Expense (billions)"] = out["Interest Expense"] / 1_000_000_000.0
-    # % GDP uses billions
-    if "GDP_billion" in out.columns:
-        with pd.option_context('mode.use_inf_as_na', True):
-            out["Interest Expense (% GDP)"] = 100.0 * (
-                out["Interest Expense (billions)"] / out["GDP_billion"].astype(float)
-            )
-    return out
-
-
-def _agg_sum(df: pd.DataFrame, group_cols: list[str]) -> pd.DataFrame:
-    grouped = (
-        df.groupby(group_cols, dropna=False)["Current Month Expense Amount"].sum().reset_index()
-    )
+    values = df["Current Month Expense Amount"].to_numpy(dtype=np.float64)
+    gdp = df["GDP_billion"].to_numpy(dtype=np.float64) if "GDP_billion" in df.columns else None
+    return df.assign(**{"Interest Expense": values}, **_unit_columns(values, gdp))
+
+
+def _marginal_sum(cube: pd.Series, unique_months: Optional[pd.DataFrame], group_cols: list[str]) -> pd.DataFrame:
+    grouped = cube.groupby(level=group_cols, dropna=False).sum().reset_index()
     grouped = grouped.rename(columns={"Current Month Expense Amount": "Interest Expense"})
 
     # Attach GDP using distinct month-level values to avoid type-weighting bias
-    if "GDP_billion" in df.columns:
-        unique_months = df[["Calendar Year", "Fiscal Year", "Month", "GDP_billion"]].drop_duplicates()
+    if unique_months is not None:
         if set(["Calendar Year", "Month"]).issubset(group_cols):
             # Use exact monthly GDP
             gdp_map = unique_months[["Calendar Year", "Month", "GDP_billion"]]
@@ -268,42 +336,78 @@ def _agg_sum(df: pd.DataFrame, group_cols: list[str]) -> pd.DataFrame:
             gdp_map = unique_months.groupby(["Fiscal Year", "Month"], dropna=False)["GDP_billion"].mean().reset_index()
             grouped = grouped.merge(gdp_map, on=["Fiscal Year", "Month"], how="left")
 
-    grouped["Interest Expense (millions)"] = grouped["Interest Expense"] / 1_000_000.0
-    grouped["Interest Expense (billions)"] = grouped["Interest Expense"] / 1_000_000_000.0
-    if "GDP_billion" in grouped.columns:
-        grouped["Interest Expense (% GDP)"] = 100.0 * (
-            grouped["Interest Expense (billions)"] / grouped["GDP_billion"].astype(float)
-        )
-    return grouped
+    values = grouped["Interest Expense"].to_numpy(dtype=np.float64)
+    gdp = grouped["GDP_billion"].to_numpy(dtype=np.float64) if "GDP_billion" in grouped.columns else None
+    return grouped.assign(**_unit_columns(values, gdp))
 
 
 def build_aggregations(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    # Sum once over the finest grouping (the "cube"); every report is then a
+    # marginal sum over that small keyed Series instead of a fresh full-frame
+    # groupby pass.
+    has_type = "Expense Type Description" in df.columns
+    cube_keys = ["Calendar Year", "Fiscal Year", "Month"] + (["Expense Type Description"] if has_type else [])
+    cube = df.groupby(cube_keys, dropna=False, sort=False)["Current Month Expense Amount"].sum()
+    unique_months = (
+        df[["Calendar Year", "Fiscal Year", "Month", "GDP_billion"]].drop_duplicates()
+        if "GDP_billion" in df.columns
+        else None
+    )
+
     tables: dict[str, pd.DataFrame] = {}
     # Granular monthly tables
-    tables["by_month_cy"] = _agg_sum(df, ["Calendar Year", "Month"]).sort_values(["Calendar Year", "Month"]).reset_index(drop=True)
-    tables["by_month_fy"] = _agg_sum(df, ["Fiscal Year", "Month"]).sort_values(["Fiscal Year", "Month"]).reset_index(drop=True)
+    tables["by_month_cy"] = _marginal_sum(cube, unique_months, ["Calendar Year", "Month"]).sort_values(["Calendar Year", "Month"]).reset_index(drop=True)
+    tables["by_month_fy"] = _marginal_sum(cube, unique_months, ["Fiscal Year", "Month"]).sort_values(["Fiscal Year", "Month"]).reset_index(drop=True)
     # By type
-    if "Expense Type Description" in df.columns:
-        tables["by_type_cy"] = _agg_sum(df, ["Calendar Year", "Expense Type Description"]).sort_values(["Calendar Year", "Expense Type Description"]).reset_index(drop=True)
-        tables["by_type_fy"] = _agg_sum(df, ["Fiscal Year", "Expense Type Description"]).sort_values(["Fiscal Year", "Expense Type Description"]).reset_index(drop=True)
+    if has_type:
+        tables["by_type_cy"] = _marginal_sum(cube, unique_months, ["Calendar Year", "Expense Type Description"]).sort_values(["Calendar Year", "Expense Type Description"]).reset_index(drop=True)
+        tables["by_type_fy"] = _marginal_sum(cube, unique_months, ["Fiscal Year", "Expense Type Description"]).sort_values(["Fiscal Year", "Expense Type Description"]).reset_index(drop=True)
     # Yearly summaries
-    tables["summary_cy"] = _agg_sum(df, ["Calendar Year"]).sort_values(["Calendar Year"]).reset_index(drop=True)
-    tables["summary_fy"] = _agg_sum(df, ["Fiscal Year"]).sort_values(["Fiscal Year"]).reset_index(drop=True)
+    tables["summary_cy"] = _marginal_sum(cube, unique_months, ["Calendar Year"]).sort_values(["Calendar Year"]).reset_index(drop=True)
+    tables["summary_fy"] = _marginal_sum(cube, unique_months, ["Fiscal Year"]).sort_values(["Fiscal Year"]).reset_index(drop=True)
     return tables
 
 # -----------------------------
 # Dev CSV writer and sanity
 # -----------------------------
-def write_temp_csv(df: pd.DataFrame, name: str, out_dir: Path | str) -> Path:
+def write_temp_csv(df: pd.DataFrame, name: str, out_dir: Path | str, fmt: str = "csv") -> Path:
     out_dir_p = Path(out_dir)
     out_dir_p.mkdir(parents=True, exist_ok=True)
     path = out_dir_p / name
+    if fmt == "parquet":
+        # Columnar/typed output; avoids CSV float formatting cost entirely.
+        # Requires a parquet engine (pyarrow/fastparquet).
+        df.to_parquet(path.with_suffix(".parquet"), index=False)
+        return path.with_suffix(".parquet")
+    df.to_csv(path, index=False)
+    return path
+
+
+def write_temp_table(df: pd.DataFrame, name: str, out_dir: Path | str, fmt: str = "parquet") -> Path:
+    """Write a dev-temp artifact, preferring Parquet (typed, columnar, ~5-20x
+    faster to write and re-read than CSV). Falls back to CSV when no parquet
+    engine is installed or when `fmt='csv'` is forced (e.g. via the CLI)."""
+    out_dir_p = Path(out_dir)
+    out_dir_p.mkdir(parents=True, exist_ok=True)
+    base = out_dir_p / name
+    if fmt == "parquet":
+        try:
+            path = base.with_suffix(".parquet")
+            df.to_parquet(path, index=False)
+            return path
+        except ImportError:
+            pass  # no pyarrow/fastparquet; fall through to CSV
+    path = base.with_suffix(".csv")
     df.to_csv(path, index=False)
     return path
 
 
 def reload_and_sanity_check_temp_csv(path: Path | str) -> None:
-    df = pd.read_csv(path)
+    path = Path(path)
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
     required_cols = {
         "Record Date",
         "Current Month Expense Amount",
@@ -373,6 +477,11 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Write final outputs (CSVs, Excel, charts, source copies) to output/historical",
     )
+    p.add_argument(
+        "--csv",
+        action="store_true",
+        help="Force CSV for dev-temp artifacts (default is Parquet when available)",
+    )
     return p
 
 
@@ -387,8 +496,9 @@ def main(argv: Optional[list[str]] = None) -> None:
     df0 = load_interest_expense(latest)
     df1 = derive_calendar_and_fiscal(df0)
 
-    temp_path = write_temp_csv(df1, args.temp_name, paths.spreadsheets_dir)
-    print(f"Wrote temp CSV: {temp_path}")
+    temp_fmt = "csv" if args.csv else "parquet"
+    temp_path = write_temp_table(df1, args.temp_name, paths.spreadsheets_dir, fmt=temp_fmt)
+    print(f"Wrote temp file: {temp_path}")
 
     # Sanity check by reloading
     reload_and_sanity_check_temp_csv(temp_path)
@@ -398,35 +508,46 @@ def main(argv: Optional[list[str]] = None) -> None:
         f"date_range={[df1['Record Date'].min(), df1['Record Date'].max()]}",
     )
 
+    # GDP expansion, join, and aggregation are shared across the --write-*
+    # flags; compute each lazily once instead of re-parsing per branch.
+    gdp_path = Path(paths.input_dir) / "GDP.csv"
+    gdp_monthly: Optional[pd.DataFrame] = None
+    joined: Optional[pd.DataFrame] = None
+    tables: Optional[dict[str, pd.DataFrame]] = None
+
+    def _get_gdp_monthly() -> pd.DataFrame:
+        nonlocal gdp_monthly
+        if gdp_monthly is None:
+            gdp_monthly = load_and_expand_gdp(gdp_path)
+        return gdp_monthly
+
+    def _get_joined() -> pd.DataFrame:
+        nonlocal joined
+        if joined is None:
+            joined = join_gdp(df1, _get_gdp_monthly())
+        return joined
+
+    def _get_tables() -> dict[str, pd.DataFrame]:
+        nonlocal tables
+        if tables is None:
+            tables = build_aggregations(_get_joined())
+        return tables
+
     if args.write_gdp:
-        gdp_path = Path(paths.input_dir) / "GDP.csv"
-        gdp_monthly = load_and_expand_gdp(gdp_path)
-        gdp_temp = write_temp_gdp(gdp_monthly, paths.spreadsheets_dir, name="temp_gdp_monthly.csv")
-        print(f"Wrote GDP monthly temp CSV: {gdp_temp}")
+        gdp_temp = write_temp_table(_get_gdp_monthly(), "temp_gdp_monthly", paths.spreadsheets_dir, fmt=temp_fmt)
+        print(f"Wrote GDP monthly temp file: {gdp_temp}")
 
     if getattr(args, "write_joined", False):
-        # Ensure we have GDP monthly
-        gdp_path = Path(paths.input_dir) / "GDP.csv"
-        gdp_monthly = load_and_expand_gdp(gdp_path)
-        joined = join_gdp(df1, gdp_monthly)
-        joined_path = write_temp_csv(joined, "temp_joined.csv", paths.spreadsheets_dir)
-        print(f"Wrote joined temp CSV: {joined_path}")
+        joined_path = write_temp_table(_get_joined(), "temp_joined", paths.spreadsheets_dir, fmt=temp_fmt)
+        print(f"Wrote joined temp file: {joined_path}")
 
     if getattr(args, "write_aggs", False):
-        gdp_path = Path(paths.input_dir) / "GDP.csv"
-        gdp_monthly = load_and_expand_gdp(gdp_path)
-        joined = join_gdp(df1, gdp_monthly)
-        tables = build_aggregations(joined)
-        for name, tdf in tables.items():
-            outp = write_temp_csv(tdf, f"temp_{name}.csv", paths.spreadsheets_dir)
-            print(f"Wrote aggregation CSV: {outp}")
+        for name, tdf in _get_tables().items():
+            outp = write_temp_table(tdf, f"temp_{name}", paths.spreadsheets_dir, fmt=temp_fmt)
+            print(f"Wrote aggregation file: {outp}")
 
     if getattr(args, "write_final", False):
-        # Prepare data
-        gdp_path = Path(paths.input_dir) / "GDP.csv"
-        gdp_monthly = load_and_expand_gdp(gdp_path)
-        joined = join_gdp(df1, gdp_monthly)
-        tables = build_aggregations(joined)
+        tables = _get_tables()
 
         # Output folders
         base_out = Path.cwd() / "output" / "historical"
@@ -445,9 +566,8 @@ def main(argv: Optional[list[str]] = None) -> None:
         # Charts
         plot_line_and_area_charts(tables, viz_dir)
 
-        # Copy source data
-        latest_interest = find_latest_interest_file(paths.input_dir)
-        copy_source_data([latest_interest, gdp_path], src_dir)
+        # Copy source data (reuse the file already located above)
+        copy_source_data([latest, gdp_path], src_dir)
         print(f"Wrote final outputs to {base_out}")
 
 
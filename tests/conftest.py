@@ -1,4 +1,5 @@
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 
 
@@ -17,6 +18,16 @@ def fixtures_dir(project_root: Path) -> Path:
     return project_root / "tests" / "fixtures"
 
 
+@pytest.fixture(scope="session")
+def modules() -> SimpleNamespace:
+    # Import the model packages once per session instead of per test
+    import aggregate
+    import io_utils
+    import model
+    import transforms
+    return SimpleNamespace(aggregate=aggregate, io_utils=io_utils, model=model, transforms=transforms)
+
+
 @pytest.fixture()
 def tmp_output_dir(tmp_path: Path) -> Path:
     out = tmp_path / "output"
@@ -1,10 +1,9 @@
-import importlib
 import pandas as pd
 import numpy as np
 
 
-def test_expand_macro_units_and_nonan():
-    io_utils = importlib.import_module('io_utils')
+def test_expand_macro_units_and_nonan(modules):
+    io_utils = modules.io_utils
 
     cfg = {
         'model': {
@@ -41,8 +40,8 @@ def test_expand_macro_units_and_nonan():
     assert float(df['nominal_gdp'].iloc[-1]) > float(df['nominal_gdp'].iloc[0])
 
 
-def test_aggregate_sanity_interest_pct_gdp_and_r_eff():
-    aggregate = importlib.import_module('aggregate')
+def test_aggregate_sanity_interest_pct_gdp_and_r_eff(modules):
+    aggregate = modules.aggregate
 
     idx = pd.date_range('2020-01-31', periods=12, freq='M')
     netint_monthly = 120.0
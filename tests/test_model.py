@@ -1,15 +1,13 @@
-import importlib
 import pandas as pd
 import numpy as np
 
 
-def test_import_model_module():
-    assert importlib.import_module('model') is not None
+def test_import_model_module(modules):
+    assert modules.model is not None
 
 
-def test_constant_rate_closed_form_debt_growth():
-    model = importlib.import_module('model')
-    transforms = importlib.import_module('transforms')
+def test_constant_rate_closed_form_debt_growth(modules):
+    model = modules.model
 
     idx = pd.date_range('2020-01-31', periods=12, freq='M')
     r = 0.06
@@ -36,12 +34,13 @@ def test_constant_rate_closed_form_debt_growth():
     S = params['share_SHORT'] + params['share_NB'] + params['share_TIPS']
     expected_last = debt0 * (1 + r * S / 12.0) ** len(idx)
     assert abs(df['Debt'].iloc[-1] - expected_last) / expected_last < 1e-6
-    # r_eff consistency
-    np.testing.assert_allclose(df['r_eff'].values[1:], 12.0 * (df['NetInt']/df['Debt'].shift(1)).values[1:], rtol=1e-12, atol=1e-12)
+    # r_eff consistency against the co-allocated lagged-debt column
+    np.testing.assert_allclose(df['r_eff'].values[1:], 12.0 * (df['NetInt']/df['Debt_prev']).values[1:], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(df['Debt_prev'].values[1:], df['Debt'].values[:-1], rtol=0, atol=0)
 
 
-def test_tips_accrual_equals_monthly_inflation_times_principal_share():
-    model = importlib.import_module('model')
+def test_tips_accrual_equals_monthly_inflation_times_principal_share(modules):
+    model = modules.model
     idx = pd.date_range('2020-01-31', periods=6, freq='M')
     infl_m = 0.003  # 0.3% monthly
     macro_df = pd.DataFrame({
@@ -66,7 +65,7 @@ def test_tips_accrual_equals_monthly_inflation_times_principal_share():
     df = model.forecast_monthly(macro_df, params, config)
     # For t>=1: Int_TIPS[t] == pce_infl_m * Debt[t-1] * share_TIPS (no /12)
     expected = macro_df['pce_infl_m'] * df['Debt'].shift(1) * params['share_TIPS']
-    # Ignore first since Debt[t-1] undefined
-    pd.testing.assert_series_equal(df['Int_TIPS'].iloc[1:].round(6), expected.iloc[1:].round(6), check_names=False)
+    # Ignore first since Debt[t-1] undefined; compare the raw buffers directly
+    np.testing.assert_allclose(df['Int_TIPS'].to_numpy()[1:], expected.to_numpy()[1:], rtol=0, atol=1e-6)
 
 
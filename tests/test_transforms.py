@@ -1,14 +1,13 @@
-import importlib
 import pandas as pd
 import numpy as np
 
 
-def test_import_transforms_module():
-    assert importlib.import_module('transforms') is not None
+def test_import_transforms_module(modules):
+    assert modules.transforms is not None
 
 
-def test_macro_yaml_loading_and_expand(fixtures_dir):
-    io_utils = importlib.import_module('io_utils')
+def test_macro_yaml_loading_and_expand(fixtures_dir, modules):
+    io_utils = modules.io_utils
     cfg = io_utils.load_macro_yaml(fixtures_dir / 'macro.yaml')
     assert 'model' in cfg and 'macro_series' in cfg
     # Expand with empty series should still return a monthly DataFrame with required columns
@@ -18,8 +17,8 @@ def test_macro_yaml_loading_and_expand(fixtures_dir):
     assert expected_cols.issubset(set(df.columns))
 
 
-def test_half_life_to_alpha_and_ema():
-    transforms = importlib.import_module('transforms')
+def test_half_life_to_alpha_and_ema(modules):
+    transforms = modules.transforms
     alpha = transforms.half_life_to_alpha(12.0)
     assert 0 < alpha < 1
     # Known relationship: after 12 months, weight halves
@@ -34,8 +33,8 @@ def test_half_life_to_alpha_and_ema():
     assert np.all(np.diff(post) > -1e-12)
 
 
-def test_weighted_curve_alignment_and_values():
-    transforms = importlib.import_module('transforms')
+def test_weighted_curve_alignment_and_values(modules):
+    transforms = modules.transforms
     idx = pd.date_range('2020-01-31', periods=3, freq='M')
     r2y = pd.Series([2.0, 2.0, 2.0], index=idx)
     r5y = pd.Series([3.0, 3.0, 3.0], index=idx)
@@ -46,24 +45,22 @@ def test_weighted_curve_alignment_and_values():
     assert np.allclose(blended.values, 0.2*2 + 0.3*3 + 0.5*4)
 
 
-def test_build_ieod_monthly_total_and_cy_fy_aggregation():
-    transforms = importlib.import_module('transforms')
-    io_utils = importlib.import_module('io_utils')
-    # Build tiny IEOD CSV-like DataFrame via loader to ensure schema handling
-    df_raw = pd.DataFrame(
-        [
-            {"Record Date": "2020-09-30", "Expense Group Description": "ACCRUED INTEREST EXPENSE", "Current Month Expense Amount": 100},
-            {"Record Date": "2020-10-31", "Expense Group Description": "ACCRUED INTEREST EXPENSE", "Current Month Expense Amount": 110},
-            {"Record Date": "2020-10-31", "Expense Group Description": "SAVINGS BONDS", "Current Month Expense Amount": 10},
-            {"Record Date": "2020-10-31", "Expense Group Description": "CASH BASIS GAS PAYMENTS", "Current Month Expense Amount": 999},
-            {"Record Date": "2020-12-31", "Expense Group Description": "ACCRUED INTEREST EXPENSE", "Current Month Expense Amount": 120},
-        ]
-    )
-    # Save to CSV-like and reload using loader to apply GAS exclusion
-    tmp = df_raw
-    df = tmp.copy()
+def test_build_ieod_monthly_total_and_cy_fy_aggregation(modules):
+    transforms = modules.transforms
+    # Build tiny IEOD-shaped DataFrame from pre-typed columns (matching the
+    # dtypes load_ieod produces) so pandas skips per-row inference
+    df = pd.DataFrame({
+        "Record Date": pd.to_datetime(["2020-09-30", "2020-10-31", "2020-10-31", "2020-10-31", "2020-12-31"]),
+        "Expense Group Description": pd.Categorical([
+            "ACCRUED INTEREST EXPENSE",
+            "ACCRUED INTEREST EXPENSE",
+            "SAVINGS BONDS",
+            "CASH BASIS GAS PAYMENTS",
+            "ACCRUED INTEREST EXPENSE",
+        ]),
+        "Current Month Expense Amount": np.array([100, 110, 10, 999, 120], dtype=np.float64),
+    })
     # Apply load_ieod-like cleaning manually here (we can reuse loader but it requires path)
-    df["Record Date"] = pd.to_datetime(df["Record Date"])  # ensure datetime
     df = df[~df["Expense Group Description"].isin({"ACCRUAL BASIS GAS EXPENSE", "CASH BASIS GAS PAYMENTS"})]
     total = transforms.build_ieod_monthly_total(df, start="2020-09-01", now="2020-12-31")
     # Expected monthly totals: Sep=100, Oct=120 (110+10), Dec=120